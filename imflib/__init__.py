@@ -1,8 +1,11 @@
 __all__ = ["assetmap","pkl","cpl","imf","opl","scm"]
 
-import datetime, re, typing, dataclasses
+import datetime, re, typing, dataclasses, uuid
 import xml.etree.ElementTree as et
 
+# Namespace for XML digital signatures (Signature elements)
+NS_DS = {"ds":"http://www.w3.org/2000/09/xmldsig#"}
+
 PAT_DATE = re.compile(r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})T(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}(?:\.\d+)?)(?P<timezone>(?:Z)|([\+\-].+))?$", re.I)
 
 @dataclasses.dataclass(frozen=True)
@@ -83,13 +86,26 @@ def xsd_datetime_to_datetime(xsd_datetime:str)->datetime:
 	if not match_date:
 		raise ValueError(f"Invalid XSD DateTime: {xsd_datetime}")
 
+	# Once validated, Python 3.11+ converts the whole XSD subset natively; 3.10 only lacks the `Z` suffix
+	try:
+		parsed = datetime.datetime.fromisoformat(xsd_datetime[:-1] + "+00:00" if xsd_datetime[-1:] in ("Z","z") else xsd_datetime)
+	except ValueError:
+		pass
+	else:
+		return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=datetime.timezone.utc)
+
 	# Reconcile timezone situation
-	if match_date.group("timezone") is None or match_date.group("timezone").lower() == 'z':
+	timezone = match_date.group("timezone")
+	if timezone is None or timezone.lower() == 'z':
 		tz_delta = datetime.timezone.utc
 	else:
-		tz_h, tz_m = tuple([float(x) for x in match_date.group("timezone").split(':')])
-		tz_delta = datetime.timezone(datetime.timedelta(hours=tz_h, minutes=tz_m))
+		tz_h, tz_m = timezone[1:].split(':')
+		tz_offset = datetime.timedelta(hours=int(tz_h), minutes=int(tz_m))
+		tz_delta = datetime.timezone(-tz_offset if timezone.startswith('-') else tz_offset)
 	
+	# Fractional seconds are a decimal fraction, not a count of microseconds
+	second, _, fraction = match_date.group("second").partition('.')
+
 	# Here we go
 	return datetime.datetime(
 		year        = int(match_date.group("year")),
@@ -97,8 +113,8 @@ def xsd_datetime_to_datetime(xsd_datetime:str)->datetime:
 		day         = int(match_date.group("day")),
 		hour        = int(match_date.group("hour")),
 		minute      = int(match_date.group("minute")),
-		second      = int(match_date.group("second").split('.')[0]),
-		microsecond = int(match_date.group("second").split('.')[1] if '.' in match_date.group("second") else 0),
+		second      = int(second),
+		microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0,
 		tzinfo      = tz_delta
 	)
 
@@ -113,13 +129,46 @@ def datetime_to_xsd_datetime(dt:datetime.datetime) -> str:
 
 
 
+def xsd_string(xml:et.Element, ns:typing.Optional[dict]=None) -> str:
+	"""Return the text of a required xs:string"""
+	return xml.text
+
+def xsd_integer(xml:et.Element, ns:typing.Optional[dict]=None) -> int:
+	"""Return the value of a required xs:integer"""
+	return int(xml.text)
+
+def xsd_uuid(xml:et.Element, ns:typing.Optional[dict]=None) -> uuid.UUID:
+	"""Return the value of a required urn:UUID"""
+	return uuid.UUID(xml.text)
+
+def xsd_parse_fields(xml:et.Element, fields:dict[str,tuple[str,typing.Callable]], ns:typing.Optional[dict]=None, required:typing.Iterable[str]=()) -> dict:
+	"""
+	Collect constructor arguments from the child elements of `xml` in a single pass.
+
+	`fields` maps a Clark-notation tag to a `(field_name, parser)` pair, where `parser` is called with the child element and `ns`.
+	Children not listed in `fields` are ignored.  Raises a `ValueError` if any of the `required` field names were not found.
+	"""
+
+	attrs = dict()
+	for child in xml:
+		spec = fields.get(child.tag)
+		if spec is not None:
+			attrs[spec[0]] = spec[1](child, ns)
+	
+	missing = [name for name in required if name not in attrs]
+	if missing:
+		raise ValueError(f"{xml.tag} is missing required element(s) for: {', '.join(missing)}")
+
+	return attrs
+
 def xsd_optional_string(xml:typing.Optional[et.Element], default_value:str="") -> typing.Union[str,None]:
 	"""Return a string that may be optionally defined in the XML"""
 	return xml.text if xml is not None else default_value
 
 def xsd_optional_integer(xml:typing.Optional[et.Element], default_value:typing.Optional[int]=None) -> typing.Union[int,None]:
 	"""Return an integer that may be optionally defined in the XML"""
-	return int(xml.text) if xml is not None and xml.text.isnumeric() else default_value
+	text = xml.text if xml is not None else None
+	return int(text) if text and text.isnumeric() else default_value
 
 def xsd_optional_bool(xml:typing.Optional[et.Element], default_value:bool=False) -> bool:
 	"""Return a `bool` from an optional `xs:bool`"""
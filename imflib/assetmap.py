@@ -12,7 +12,13 @@ import dataclasses, typing, datetime, uuid
 import xml.etree.ElementTree as et
 from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, xsd_optional_integer, xsd_optional_bool, UserText
 
-@dataclasses.dataclass(frozen=True)
+NS_AM = "http://www.smpte-ra.org/schemas/429-9/2007/AM"
+"""The asset map namespace"""
+
+NS_AM_DEFAULT = {"":NS_AM}
+"""Namespace map with the asset map namespace as the default, for `find` and friends"""
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class AssetMap:
 	"""An Asset Map component of an IMF package"""
 
@@ -41,7 +47,7 @@ class AssetMap:
 	def from_file(cls, path:str)->"AssetMap":
 		"""Parse an existing AssetMap file"""
 		file_am = et.parse(path)
-		return cls.from_xml(file_am.getroot(),{"":"http://www.smpte-ra.org/schemas/429-9/2007/AM"})
+		return cls.from_xml(file_am.getroot(),NS_AM_DEFAULT)
 	
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"AssetMap":
@@ -89,7 +95,7 @@ class AssetMap:
 
 # TODO: Per SMPTE 0429-9-2014 update, "The VolumeIndex structure is not used."
 # However, some example IMFs seem to include a VOLINDEX.  Research further.
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VolumeIndex:
 	"""A `VolumeIndex` file required only in multi-volume packages"""
 
@@ -100,7 +106,7 @@ class VolumeIndex:
 	def from_file(cls, path:str)->"VolumeIndex":
 		"""Parse an existing VolumeIndex file"""
 		file_am = et.parse(path)
-		return cls.from_xml(file_am.getroot(),{"":"http://www.smpte-ra.org/schemas/429-9/2007/AM"})
+		return cls.from_xml(file_am.getroot(),NS_AM_DEFAULT)
 	
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"AssetMap":
@@ -110,7 +116,7 @@ class VolumeIndex:
 		)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Asset:
 	"""An Asset as defined in an IMF AssetMap"""
 
@@ -160,7 +166,7 @@ class Asset:
 		"""All file paths associated with this asset"""
 		return [chunk.file_path for chunk in self.chunks]
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Chunk:
 	"""A chunk of an Asset"""
 
@@ -1,3 +1,4 @@
+# cython: language_level=3
 """`Composition Playlist` and its related classes
 
 Based on st-2067-3-2020: https://ieeexplore.ieee.org/document/9097510/
@@ -16,14 +17,44 @@ resolved by cross-referencing the UUID in :attr:`TrackFileResource.track_file_id
 
 from xml.dom.minidom import Element
 import xml.etree.ElementTree as et
-import dataclasses, typing, re, abc, datetime, uuid
+import dataclasses, typing, re, abc, datetime, uuid, concurrent.futures
 from posttools import timecode
-from imflib import xsd_datetime_to_datetime, xsd_optional_string, xsd_optional_integer, xsd_optional_bool, xsd_optional_usertext, xsd_optional_security
-from imflib import UserText, Security
+from imflib import xsd_datetime_to_datetime, xsd_optional_bool, xsd_optional_usertext, xsd_optional_security
+from imflib import xsd_string, xsd_integer, xsd_uuid, xsd_parse_fields
+from imflib import UserText, Security, NS_DS
 
 pat_nsextract = re.compile(r'^\{(?P<uri>.+)\}(?P<name>[a-z0-9]+)',re.I)
 
-@dataclasses.dataclass(frozen=True)
+NS_CPL = "http://www.smpte-ra.org/schemas/2067-3/2016"
+"""The CPL namespace used by :meth:`Cpl.from_file`"""
+
+NS_CPL_DEFAULT = {"":NS_CPL}
+"""Namespace map with the CPL namespace as the default, for `find` and friends"""
+
+def cpl_namespace(ns:typing.Optional[dict]=None) -> str:
+	"""The default namespace URI of a namespace map, or :data:`NS_CPL` if it has none"""
+	return ns.get("", NS_CPL) if ns else NS_CPL
+
+def cpl_tag(name:str, ns:typing.Optional[dict]=None) -> str:
+	"""Qualify a CPL element name in Clark notation (`{uri}name`), using the default namespace of `ns`"""
+	return f"{{{cpl_namespace(ns)}}}{name}"
+
+# Field tables re-keyed to other CPL namespaces, by (table id, namespace URI)
+_fields_by_namespace:dict[tuple[int,str],dict] = dict()
+
+def cpl_fields(fields:dict, ns:typing.Optional[dict]=None) -> dict:
+	"""Return a module-level field table re-keyed from :data:`NS_CPL` to the default namespace of `ns`"""
+	uri = cpl_namespace(ns)
+	if uri == NS_CPL:
+		return fields
+	
+	key = (id(fields), uri)
+	if key not in _fields_by_namespace:
+		prefix = f"{{{NS_CPL}}}"
+		_fields_by_namespace[key] = {(f"{{{uri}}}{tag[len(prefix):]}" if tag.startswith(prefix) else tag):spec for tag, spec in fields.items()}
+	return _fields_by_namespace[key]
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class BaseResource(abc.ABC):
 	"""A BaseResource XSD within a sequence"""
 
@@ -54,41 +85,27 @@ class BaseResource(abc.ABC):
 	repeat_count:int=1
 	"""The number of times the playable region is to be repeated"""
 
-	# References
-	_src_sequence:typing.Optional["Sequence"]=None
-	_src_offset:int=0
+	# References (excluded from comparison since they point back up the tree)
+	_src_sequence:typing.Optional["Sequence"]=dataclasses.field(default=None, repr=False, compare=False)
+	_src_offset:int=dataclasses.field(default=0, repr=False, compare=False)
 
-	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "BaseResource":
-		
-		# BaseResource
-		id = uuid.UUID(xml.find("Id",ns).text)
-		intrinsic_duration = int(xml.find("IntrinsicDuration",ns).text)
+	# Derived in __post_init__, since the fields it depends on never change
+	_duration:int=dataclasses.field(default=0, init=False, repr=False, compare=False)
 
-		
-		# BaseResource Optional
-		annotation = xsd_optional_usertext(xml.find("Annotation",ns))
-		edit_rate = EditRate.from_xml(xml.find("EditRate",ns), ns) if xml.find("EditRate",ns) is not None else None
-		entry_point = xsd_optional_integer(xml.find("EntryPoint",ns),0)
-		source_duration = xsd_optional_integer(xml.find("SourceDuration",ns))
-		repeat_count = xsd_optional_integer(xml.find("RepeatCount",ns), 1)
+	# Cached on first access
+	_timecode_range:typing.Optional[timecode.TimecodeRange]=dataclasses.field(default=None, init=False, repr=False, compare=False)
 
-		return cls(
-			id=id,
-			intrinsic_duration=intrinsic_duration,
-			annotation=annotation,
-			edit_rate=edit_rate,
-			entry_point=entry_point,
-			source_duration=source_duration,
-			repeat_count=repeat_count
-		)
+	@classmethod
+	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "BaseResource":
+		"""Parse a resource from XML"""
+		return cls(**xsd_parse_fields(xml, cpl_fields(BASE_RESOURCE_FIELDS, ns), ns, required=("id","intrinsic_duration")))
 
 	def __post_init__(self):
 		"""Validate additional constraints per st2067-3-2020 (6.11)"""
 
 		# Generated values
 		# If absent, it shall be equal to IntrinsicDuration – EntryPoint.
-		if self.source_duration is None: self.source_duration = self.intrinsic_duration-self.entry_point
+		if self.source_duration is None: object.__setattr__(self, "source_duration", self.intrinsic_duration-self.entry_point)
 		
 		# Non-negative integers
 		if self.intrinsic_duration < 0: raise ValueError("The intrinsic duration must be provided as a non-negative integer")
@@ -101,11 +118,13 @@ class BaseResource(abc.ABC):
 		# Bound integers
 		if self.source_duration > (self.intrinsic_duration-self.entry_point):
 			raise ValueError("The source duration must not exceed IntrinsicDuration-EntryPoint")
+		
+		object.__setattr__(self, "_duration", self.source_duration  + (self.source_duration * self.repeat_count))
 
 	@property
 	def duration(self) -> int:
 		"""Duration in frames for now"""
-		return self.source_duration  + (self.source_duration * self.repeat_count)
+		return self._duration
 	
 	@property
 	def edit_range(self) -> timecode.TimecodeRange:
@@ -121,14 +140,16 @@ class BaseResource(abc.ABC):
 	@property
 	def timecode_range(self) -> timecode.TimecodeRange:
 		"""Timecode range relative to CPL"""
-		tc_start = self._src_sequence.timecode_range.start + self._src_offset
-		tc_duration = timecode.Timecode(self.duration, float(self.edit_rate or tc_start.rate)).resample(tc_start.rate)
-		return timecode.TimecodeRange(
-			start    = tc_start,
-			duration = tc_duration
-		)
-
-@dataclasses.dataclass(frozen=True)
+		if self._timecode_range is None:
+			tc_start = self._src_sequence.timecode_range.start + self._src_offset
+			tc_duration = timecode.Timecode(self.duration, float(self.edit_rate or tc_start.rate)).resample(tc_start.rate)
+			object.__setattr__(self, "_timecode_range", timecode.TimecodeRange(
+				start    = tc_start,
+				duration = tc_duration
+			))
+		return self._timecode_range
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class TrackFileResource(BaseResource):
 	"""A file-based resource"""
 
@@ -152,61 +173,50 @@ class TrackFileResource(BaseResource):
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"TrackFileResource":
 		"""Parse a file-based resource from XML"""
-
-		base = super().from_xml(xml, ns)
-
-		# TrackFileResource
-		source_encoding = uuid.UUID(xml.find("SourceEncoding",ns).text)
-		track_file_id = uuid.UUID(xml.find("TrackFileId",ns).text)
-		
-		# TrackResource Optional
-		key_id = uuid.UUID(xml.find("KeyId",ns)) if xml.find("KeyId",ns) is not None else None
-		hash = xsd_optional_string(xml.find("Hash",ns))
-		hash_algorithm = xsd_optional_string(xml.find("HashAlgorithm",ns))
-
-
-		return dataclasses.replace(
-			base,
-			source_encoding=source_encoding,
-			track_file_id=track_file_id,
-			key_id=key_id,
-			hash=hash,
-			hash_algorithm=hash_algorithm
-		)
-
-@dataclasses.dataclass(frozen=True)
+		return cls(**xsd_parse_fields(xml, cpl_fields(TRACK_FILE_RESOURCE_FIELDS, ns), ns, required=("id","intrinsic_duration","source_encoding","track_file_id")))
+
+# Child elements of a BaseResourceType
+BASE_RESOURCE_FIELDS = {
+	cpl_tag("Id"):                ("id",                 xsd_uuid),
+	cpl_tag("Annotation"):        ("annotation",         UserText.from_xml),
+	cpl_tag("EditRate"):          ("edit_rate",          lambda xml, ns: EditRate.from_xml(xml, ns)),
+	cpl_tag("IntrinsicDuration"): ("intrinsic_duration", xsd_integer),
+	cpl_tag("EntryPoint"):        ("entry_point",        xsd_integer),
+	cpl_tag("SourceDuration"):    ("source_duration",    xsd_integer),
+	cpl_tag("RepeatCount"):       ("repeat_count",       xsd_integer),
+}
+
+# Child elements of a TrackFileResourceType
+TRACK_FILE_RESOURCE_FIELDS = {
+	**BASE_RESOURCE_FIELDS,
+	cpl_tag("SourceEncoding"):    ("source_encoding",    xsd_uuid),
+	cpl_tag("TrackFileId"):       ("track_file_id",      xsd_uuid),
+	cpl_tag("KeyId"):             ("key_id",             xsd_uuid),
+	cpl_tag("Hash"):              ("hash",               xsd_string),
+	cpl_tag("HashAlgorithm"):     ("hash_algorithm",     xsd_string),
+}
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ImageResource(TrackFileResource):
 	"""A main image resource"""
 
 	edit_units_label:str = "fps"
-
-	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "ImageResource":
-		"""Parse an image resource from XML"""
-		res = super().from_xml(xml,ns)
-		return res
 	
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AudioResource(TrackFileResource):
 	"""A main audio resource"""
 
 	edit_units_label:str = "Hz"
 
-	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "AudioResource":
-		"""Parse an audio resource from XML"""
-		res = super().from_xml(xml,ns)
-		return res
-
 # TODO: Markers are untested (no samples available)
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MarkerResource(BaseResource):
 	"""A CPL Marker"""
 
 	# TODO: The native duration of a MarkerResourceType instance, as indicated by the IntrinsicDuration element, 
 	# shall be set to any value equal or larger to the largest Offset value within all its Marker elements (6.13)
 
-	@dataclasses.dataclass(frozen=True)
+	@dataclasses.dataclass(frozen=True, slots=True)
 	class MarkerLabel:
 		"""The marker label"""
 
@@ -214,7 +224,7 @@ class MarkerResource(BaseResource):
 		"""The kind of marker"""
 		# TODO: Validate default against allowed types?
 
-		scope:str="http://www.smpte-ra.org/schemas/2067-3/2013#standardmarkers"
+		scope:str="http://www.smpte-ra.org/schemas/2067-3/2013#standard-markers"
 		"""The defined set of possible labels"""
 
 		def __str__(self) -> str:
@@ -226,7 +236,7 @@ class MarkerResource(BaseResource):
 
 			return cls(
 				label_text=xml.text,
-				scope=xml.attrib.get("scope","http://www.smpte-ra.org/schemas/2067-3/2013#standardmarkers")
+				scope=xml.attrib.get("scope","http://www.smpte-ra.org/schemas/2067-3/2013#standard-markers")
 			)
 
 	label:MarkerLabel=dataclasses.field(default_factory=MarkerLabel)
@@ -239,20 +249,17 @@ class MarkerResource(BaseResource):
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "MarkerResource":
 		"""Parse a Marker resource from XML"""
-		
-		base = super().from_xml(xml, ns)
+		return cls(**xsd_parse_fields(xml, cpl_fields(MARKER_RESOURCE_FIELDS, ns), ns, required=("id","intrinsic_duration","label","offset")))
 
-		label = cls.MarkerLabel.from_xml(xml.find("Label",ns))
-		offset = int(xml.find("Offset",ns).text)
+# Child elements of a MarkerResourceType
+MARKER_RESOURCE_FIELDS = {
+	**BASE_RESOURCE_FIELDS,
+	cpl_tag("Label"):             ("label",              MarkerResource.MarkerLabel.from_xml),
+	cpl_tag("Offset"):            ("offset",             xsd_integer),
+}
 
-		return dataclasses.replace(
-			base,
-			label=label,
-			offset=offset
-		)
 
-
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Sequence:
 	"""A sequence within a segment"""
 
@@ -262,63 +269,76 @@ class Sequence:
 	track_id:uuid.UUID=dataclasses.field(default_factory=uuid.uuid4)
 	"""UUID of the virtual track to which the sequence belongs"""
 
-	_resources:typing.List[BaseResource]=dataclasses.field(default_factory=list())
+	_resources:typing.List[BaseResource]=dataclasses.field(default_factory=list)
 	# TODO: Look into getting and setting resources list; the underscore in the constructor is weird
 
-	# References
-	_src_segment:typing.Optional["Segment"]=None
-	_src_offset:int=0
+	# References (excluded from comparison since they point back up the tree)
+	_src_segment:typing.Optional["Segment"]=dataclasses.field(default=None, repr=False, compare=False)
+	_src_offset:int=dataclasses.field(default=0, repr=False, compare=False)
+
+	# Derived in __post_init__ from the resources as given
+	_duration:int=dataclasses.field(default=0, init=False, repr=False, compare=False)
+
+	# Cached on first access
+	_timecode_range:typing.Optional[timecode.TimecodeRange]=dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		"""Bind each resource back to this sequence in place"""
+
+		# The timeline of a Sequence shall consist of the concatenation, without gaps, of the timeline of all its Resources
+		# in the order they appear in the ResourceList element
+		rel_offset = 0
+		for res in self._resources:
+			object.__setattr__(res, "_src_sequence", self)
+			object.__setattr__(res, "_src_offset", rel_offset)
+			object.__setattr__(res, "_timecode_range", None)
+			rel_offset += res.duration
+		
+		object.__setattr__(self, "_duration", rel_offset)
 
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "Sequence":
 		"""Parse from XML"""
 
+		# Sequence types come from several namespaces (Core Constraints, CPL, RDD 47), so dispatch on the local name
 		# TODO: Maybe be more sensitive to the namespaces
+		sequence_type = SEQUENCE_TYPES.get(xml.tag.rpartition("}")[2])
 
-		if xml.tag.endswith("MainImageSequence"):
-			return MainImageSequence.from_xml(xml, ns)
-		
-		elif xml.tag.endswith("MainAudioSequence"):
-			return MainAudioSequence.from_xml(xml, ns)
-		
-		elif xml.tag.endswith("MarkerSequence"):
-			return MarkerSequence.from_xml(xml, ns)
-		
-		elif xml.tag.endswith("ISXDSequence"):
-			return ISXDSequence.from_xml(xml, ns)
-		
 		# TODO: Implement additional
-		else:
+		if sequence_type is None:
 			raise NotImplementedError(f"Unknown/unsupported/scary sequence type: {xml.tag}")
+		
+		return sequence_type.from_xml(xml, ns)
 	
 	@property
 	def resources(self) -> typing.Iterator["BaseResource"]:
-		rel_offset = 0
-		for res in self._resources:
-			yield dataclasses.replace(
-				res,
-				_src_sequence = self,
-				_src_offset   = rel_offset
-			)
-			rel_offset += res.duration
+		return iter(self._resources)
 	
 	@property
 	def duration(self) -> int:
 		"""Duration in frames for now"""
-		# The timeline of a Sequence shall consist of the concatenation, without gaps, of the timeline of all its Resources
-		# in the order they appear in the ResourceList element
-		return sum(res.duration for res in self.resources)
+		return self._duration
 
 	@property
 	def timecode_range(self) -> timecode.TimecodeRange:
 		"""Timecode range relative to CPL"""
-		tc_start = self._src_segment.timecode_range.start
-		tc_duration = timecode.Timecode(self.duration, tc_start.rate, tc_start.mode)
-		return timecode.TimecodeRange(
-			start    = tc_start,
-			duration = tc_duration
-		)
-
+		if self._timecode_range is None:
+			tc_start = self._src_segment.timecode_range.start
+			tc_duration = timecode.Timecode(self.duration, tc_start.rate, tc_start.mode)
+			object.__setattr__(self, "_timecode_range", timecode.TimecodeRange(
+				start    = tc_start,
+				duration = tc_duration
+			))
+		return self._timecode_range
+
+# Child elements of a SequenceType; ResourceList is left as an element for each sequence type to parse
+SEQUENCE_FIELDS = {
+	cpl_tag("Id"):           ("id",         xsd_uuid),
+	cpl_tag("TrackId"):      ("track_id",   xsd_uuid),
+	cpl_tag("ResourceList"): ("_resources", lambda xml, ns: xml),
+}
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class MainImageSequence(Sequence):
 	"""An XSD MainImageSequenceType from IMF Core Constraints"""
 
@@ -326,30 +346,22 @@ class MainImageSequence(Sequence):
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "MainImageSequence":
 		"""Parse from XML"""
 		
-		id = uuid.UUID(xml.find("Id",ns).text)
-		track_id = uuid.UUID(xml.find("TrackId",ns).text)
-		
-		resource_list = list()
-		for resource in xml.find("ResourceList",ns).findall("Resource",ns):
-			resource_list.append(ImageResource.from_xml(resource, ns))
-
-		return cls(id=id, track_id=track_id, _resources=resource_list)
+		attrs = xsd_parse_fields(xml, cpl_fields(SEQUENCE_FIELDS, ns), ns, required=("id","track_id","_resources"))
+		attrs["_resources"] = [ImageResource.from_xml(resource, ns) for resource in attrs["_resources"]]
+		return cls(**attrs)
 
+@dataclasses.dataclass(frozen=True, slots=True)
 class MainAudioSequence(Sequence):
 	"""Main audio sequence of a segment"""
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "MainImageSequence":
 		"""Parse from XML"""
-		id = uuid.UUID(xml.find("Id",ns).text)
-		track_id = uuid.UUID(xml.find("TrackId",ns).text)
-		
-		resource_list = list()
-		for resource in xml.find("ResourceList",ns).findall("Resource",ns):
-			resource_list.append(AudioResource.from_xml(resource, ns))
-
-		return cls(id=id, track_id=track_id, _resources=resource_list)
+		attrs = xsd_parse_fields(xml, cpl_fields(SEQUENCE_FIELDS, ns), ns, required=("id","track_id","_resources"))
+		attrs["_resources"] = [AudioResource.from_xml(resource, ns) for resource in attrs["_resources"]]
+		return cls(**attrs)
 
 # TODO: MarkerSequence is untested
+@dataclasses.dataclass(frozen=True, slots=True)
 class MarkerSequence(Sequence):
 	"""Marker sequence"""
 
@@ -357,15 +369,11 @@ class MarkerSequence(Sequence):
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "MarkerSequence":
 		"""Parse a Marker sequence from XML"""
 
-		id = uuid.UUID(xml.find("Id",ns).text)
-		track_id = uuid.UUID(xml.find("TrackId",ns).text)
-		
-		resource_list = list()
-		for resource in xml.find("ResourceList",ns).findall("Resource",ns):
-			resource_list.append(MarkerResource.from_xml(resource, ns))
-
-		return cls(id=id, track_id=track_id, _resources=resource_list)
+		attrs = xsd_parse_fields(xml, cpl_fields(SEQUENCE_FIELDS, ns), ns, required=("id","track_id","_resources"))
+		attrs["_resources"] = [MarkerResource.from_xml(resource, ns) for resource in attrs["_resources"]]
+		return cls(**attrs)
 
+@dataclasses.dataclass(frozen=True, slots=True)
 class ISXDSequence(Sequence):
 	"""
 	SMPTE RDD 47-2018 isochronous sequence
@@ -377,21 +385,20 @@ class ISXDSequence(Sequence):
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "ISXDSequence":
 		"""Parse ISXDSequence from XML"""
 
-#		if isinstance(ns, dict):
-#			ns.update({
-#				"":"http://www.dolby.com/schemas/RDD-47/2018",
-#				"cpl":"http://www.smpte-ra.org/schemas/2067-3/2016",
-#				"xs":"http://www.w3.org/2001/XMLSchema"
-#			})
-		
-		id = uuid.UUID(xml.find("Id",ns).text)
-		track_id = uuid.UUID(xml.find("TrackId",ns).text)
+		attrs = xsd_parse_fields(xml, cpl_fields(SEQUENCE_FIELDS, ns), ns, required=("id","track_id","_resources"))
 
 		# NOTE: Each ISXDSequence element shall contain Resource elements of type TrackFileResourceType. (Sctn 6)
-		resource_list = [TrackFileResource.from_xml(resource,ns) for resource in xml.findall("ResourceList/Resource",ns)]
-		return cls(id=id, track_id=track_id, _resources=resource_list)
+		attrs["_resources"] = [TrackFileResource.from_xml(resource, ns) for resource in attrs["_resources"]]
+		return cls(**attrs)
 
-@dataclasses.dataclass(frozen=True)
+SEQUENCE_TYPES = {
+	"MainImageSequence": MainImageSequence,
+	"MainAudioSequence": MainAudioSequence,
+	"MarkerSequence":    MarkerSequence,
+	"ISXDSequence":      ISXDSequence,
+}
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Segment:
 	"""A CPL segment"""
 	
@@ -401,21 +408,33 @@ class Segment:
 	id:uuid.UUID=dataclasses.field(default_factory=uuid.uuid4)
 	"""UUID of the segment"""
 
-	_sequences:typing.List[Sequence]=dataclasses.field(default_factory=list())
+	_sequences:typing.List[Sequence]=dataclasses.field(default_factory=list)
 	"""An internal list of sequences belonging to this segment"""
 	# TODO: Look into getting and setting sequences list; the underscore in the constructor is weird
 
-	# References
-	_src_cpl:typing.Optional["Cpl"]=None
-	_src_offset:int=0
+	# References (excluded from comparison since they point back up the tree)
+	_src_cpl:typing.Optional["Cpl"]=dataclasses.field(default=None, repr=False, compare=False)
+	_src_offset:int=dataclasses.field(default=0, repr=False, compare=False)
+
+	# Cached on first access
+	_timecode_range:typing.Optional[timecode.TimecodeRange]=dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		"""Bind each sequence back to this segment in place"""
+
+		# Sequences within a segment play in parallel, so all of them start with the segment
+		for seq in self._sequences:
+			object.__setattr__(seq, "_src_segment", self)
+			object.__setattr__(seq, "_src_offset", 0)
+			object.__setattr__(seq, "_timecode_range", None)
 
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]) -> "Segment":
 		"""Parse a Segment from XML"""
 
-		id = uuid.UUID(xml.find("Id",ns).text)
-		annotation = xsd_optional_usertext(xml.find("Annotation",ns))
-		sequence_list = [Sequence.from_xml(sequence,ns) for sequence in xml.find("SequenceList",ns)]
+		id = uuid.UUID(xml.find(cpl_tag("Id", ns)).text)
+		annotation = xsd_optional_usertext(xml.find(cpl_tag("Annotation", ns)))
+		sequence_list = [Sequence.from_xml(sequence,ns) for sequence in xml.find(cpl_tag("SequenceList", ns))]
 
 		return cls(
 			id=id,
@@ -433,15 +452,7 @@ class Segment:
 	@property
 	def sequences(self) -> typing.Iterator["Sequence"]:
 		"""A list of sequences belonging to this segment"""
-
-		rel_offset = 0
-		for seq in self._sequences:
-			yield dataclasses.replace(
-				seq,
-				_src_segment = self,
-				_src_offset  = rel_offset
-			)
-			rel_offset += seq.duration
+		return iter(self._sequences)
 	
 	@property
 	def duration(self) -> int:
@@ -452,26 +463,29 @@ class Segment:
 	@property
 	def timecode_range(self) -> timecode.TimecodeRange:
 		"""Timecode range relative to CPL"""
-		tc_start = self._src_cpl.timecode_range.start + self._src_offset
-		tc_duration = timecode.Timecode(self.duration, tc_start.rate, tc_start.mode)
-		return timecode.TimecodeRange(
-			start    = tc_start,
-			duration = tc_duration
-		)
+		if self._timecode_range is None:
+			tc_start = self._src_cpl.timecode_range.start + self._src_offset
+			tc_duration = timecode.Timecode(self.duration, tc_start.rate, tc_start.mode)
+			object.__setattr__(self, "_timecode_range", timecode.TimecodeRange(
+				start    = tc_start,
+				duration = tc_duration
+			))
+		return self._timecode_range
 
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContentVersion:
 	"""A version of the content represented in the CPL"""
 
-	label:UserText
+	# NOTE: Equality and hashing go by `id` alone, as two ContentVersions with the same Id represent the same content
+	label:UserText=dataclasses.field(compare=False)
 	"""Description of the version of the content"""
 
 	id:uuid.UUID=dataclasses.field(default_factory=uuid.uuid4)
 	"""UUID of the content represented by the CPL"""
 
-	additional_properties:list[et.Element]=dataclasses.field(default_factory=list)
+	additional_properties:list[et.Element]=dataclasses.field(default_factory=list, compare=False)
 	"""Additional properties of this content version"""
 	# TODO: Investigate handling of xs:any tags, ambiguous in spec
 
@@ -479,22 +493,21 @@ class ContentVersion:
 	def from_xml(cls, xml:et.ElementTree, ns:typing.Optional[dict]=None)->"ContentVersion":
 		"""Parse a ContentVersion from XML"""
 		
-		id = uuid.UUID(xml.find("Id",ns).text)
-		label = UserText.from_xml(xml.find("LabelText",ns))
+		xml_id = xml.find(cpl_tag("Id", ns))
+		xml_label = xml.find(cpl_tag("LabelText", ns))
+
+		id = uuid.UUID(xml_id.text)
+		label = UserText.from_xml(xml_label)
 
 		# TODO: Seems kind of hacky here
-		standard = {
-			xml.find("Id",ns),
-			xml.find("LabelText",ns)
-		}
-		additional_properties = [prop for prop in xml if prop not in standard]
+		additional_properties = [prop for prop in xml if prop is not xml_id and prop is not xml_label]
 		return cls(
 			id=id,
 			label=label,
 			additional_properties=additional_properties
 		)
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EssenceDescriptor:
 	"""A description of an essence"""
 	# TODO: I'm sure we'll need to subclass this at some point for common types
@@ -502,19 +515,17 @@ class EssenceDescriptor:
 	id:uuid.UUID=dataclasses.field(default_factory=uuid.uuid4)
 	"""Unique identifier for this CPL encoded as a urn:UUID [RFC 4122]"""
 
-	descriptor_data:list[et.Element]=dataclasses.field(default_factory=list())
+	descriptor_data:list[et.Element]=dataclasses.field(default_factory=list)
 	"""The raw XML data for this essence descriptor"""
 
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "EssenceDescriptor":
 		"""Parse an essence descriptor from its XML"""
-		id = uuid.UUID(xml.find("Id",ns).text)
+		xml_id = xml.find(cpl_tag("Id", ns))
+		id = uuid.UUID(xml_id.text)
 
 		# TODO: Seems kind of hacky here
-		standard = {
-			xml.find("Id",ns),
-		}
-		descriptor_data = [prop for prop in xml if prop not in standard]
+		descriptor_data = [prop for prop in xml if prop is not xml_id]
 
 		return cls(
 			id=id,
@@ -522,7 +533,7 @@ class EssenceDescriptor:
 		)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContentMaturityRating:
 	"""Content maturity rating and info"""
 	
@@ -538,10 +549,10 @@ class ContentMaturityRating:
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict])->"ContentMaturityRating":
 		"""Parse a ContentMaturtyRatingType from a ContentMaturityRatingList"""
-		agency = xml.find("Agency",ns).text
-		rating = xml.find("Rating",ns).text
+		agency = xml.find(cpl_tag("Agency", ns)).text
+		rating = xml.find(cpl_tag("Rating", ns)).text
 
-		audiences = {aud.attrib.get("scope"):aud.text for aud in xml.findall("Audience",ns)}
+		audiences = {aud.attrib.get("scope"):aud.text for aud in xml.iterfind(cpl_tag("Audience", ns))}
 		
 		return cls(
 			agency=agency,
@@ -549,7 +560,7 @@ class ContentMaturityRating:
 			audiences=audiences
 		)
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Locale:
 	"""Locale-specific information"""
 
@@ -568,76 +579,87 @@ class Locale:
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "Locale":
 		"""Parse a LocaleType from a LocaleListType"""
+		return cls(**xsd_parse_fields(xml, cpl_fields(LOCALE_FIELDS, ns), ns))
 
-		annotation = xsd_optional_usertext(xml.find("Annotation",ns))
-		
-		languages = list()
-		ll = xml.find("LanguageList",ns)
-		if ll:
-			for lang in ll:
-				languages.append(lang.text)
-		
-		regions = list()
-		rl = xml.find("RegionList",ns)
-		if rl:
-			for reg in rl:
-				regions.append(reg.text)
-
-		ratings = []
-		ral = xml.find("ContentMaturityRatingList",ns)
-		if ral:
-			for rating in ral:
-				ratings.append(ContentMaturityRating.from_xml(rating, ns))
-			
-		return cls(
-			annotation=annotation,
-			languages=languages,
-			regions=regions,
-			content_maturity_ratings=ratings
-		)
-		
+# Child elements of a LocaleType
+LOCALE_FIELDS = {
+	cpl_tag("Annotation"):                ("annotation",               UserText.from_xml),
+	cpl_tag("LanguageList"):              ("languages",                lambda xml, ns: [lang.text for lang in xml]),
+	cpl_tag("RegionList"):                ("regions",                  lambda xml, ns: [reg.text for reg in xml]),
+	cpl_tag("ContentMaturityRatingList"): ("content_maturity_ratings", lambda xml, ns: [ContentMaturityRating.from_xml(rating, ns) for rating in xml]),
+}
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, slots=True, init=False, repr=False)
 class ExtensionProperty:
 	"""Application extension"""
 	# TODO: Spec loosely defines as lax processing, any namespace. Cool.
 	# TODO: Decide upon a better implementation.
-	raw_xml:str
+	element:typing.Optional[et.Element]
+	"""The extension property as parsed, if it was read from XML"""
+
+	# Serialized on first access when parsed from XML
+	_raw_xml:typing.Optional[str]=dataclasses.field(compare=False)
+
+	def __init__(self, raw_xml:typing.Optional[str]=None, element:typing.Optional[et.Element]=None):
+		"""Wrap an extension property given as an XML string (`raw_xml`) or as a parsed `element`"""
+		object.__setattr__(self, "element", element)
+		object.__setattr__(self, "_raw_xml", raw_xml)
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}(raw_xml={self.raw_xml!r})"
 
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"ExtensionProperty":
 		"""Capture an extention property from the list"""
-		try:
-			raw_xml = et.tostring(xml, encoding="unicode", method="xml").strip()
-		except Exception as e:
-			raw_xml = f"Unknown extension property: {e}"
-		
-		return cls(raw_xml)
-
-@dataclasses.dataclass(frozen=True)
+		return cls(element=xml)
+	
+	@property
+	def raw_xml(self) -> str:
+		"""The extension property as an XML string"""
+		if self._raw_xml is None:
+			try:
+				raw_xml = et.tostring(self.element, encoding="unicode", method="xml").strip()
+			except Exception as e:
+				raw_xml = f"Unknown extension property: {e}"
+			object.__setattr__(self, "_raw_xml", raw_xml)
+		return self._raw_xml
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class EditRate:
 	"""A rational edit rate"""
 	
 	edit_rate:tuple[int,int]
 	"""The edit rate as a ratio of two integers"""
 
+	# Derived from `edit_rate` once, since it never changes
+	_decimal:float=dataclasses.field(init=False, repr=False, compare=False)
+	_str:str=dataclasses.field(init=False, repr=False, compare=False)
+
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "EditRate":
 		"""Parse EditRateType from XML"""
-		return cls(tuple(int(x) for x in xml.text.split(' ')))
+		numerator, denominator = map(int, xml.text.split())
+		return cls((numerator, denominator))
+	
+	def __post_init__(self):
+		"""Precompute the decimal and string representations"""
+		decimal = float(self.edit_rate[0]) / float(self.edit_rate[1])
+		object.__setattr__(self, "_decimal", decimal)
+		object.__setattr__(self, "_str", str(round(decimal)) if decimal.is_integer() else str(round(decimal,2)))
 	
 	@property
 	def decimal(self) -> float:
 		"""Edit rate as a float"""
-		return float(self.edit_rate[0]) / float(self.edit_rate[1])
+		return self._decimal
 
 	def __float__(self) -> float:
-		return self.decimal
+		return self._decimal
 	
 	def __str__(self) -> str:
-		return str(round(self.decimal)) if self.decimal.is_integer() else str(round(self.decimal,2))
+		return self._str
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContentKind:
 	"""The kind of content undelying the composition"""
 
@@ -660,7 +682,7 @@ class ContentKind:
 			scope=xml.attrib.get("scope")
 		)
 		
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Cpl:
 	"""An IMF Composition Playlist"""
 
@@ -699,8 +721,8 @@ class Cpl:
 	tc_start:typing.Optional[timecode.Timecode]=None
 	"""The starting timecode of this CPL"""
 
-	content_versions:set["ContentVersion"]=dataclasses.field(default_factory=set)
-	"""The specific version or revision of the content in this CPL"""
+	content_versions:list["ContentVersion"]=dataclasses.field(default_factory=list)
+	"""The specific versions or revisions of the content in this CPL, in document order"""
 	#TODO: "No two ContentVersion elements shall have identical Id elements."
 	#TODO: "Two Composition Playlist instances shall be assumed to refer to the same 
 	# content if they have in common at least one Id element of a ContentVersion element."
@@ -719,6 +741,35 @@ class Cpl:
 	security:typing.Optional[Security]=None
 	"""XML signer and signature"""
 
+	# Cached on first access
+	_timecode_range:typing.Optional[timecode.TimecodeRange]=dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+	# Indexes built by __post_init__
+	_segments_flat:tuple["Segment",...]=dataclasses.field(default=(), init=False, repr=False, compare=False)
+	_sequences_flat:tuple["Sequence",...]=dataclasses.field(default=(), init=False, repr=False, compare=False)
+	_resources_flat:tuple["BaseResource",...]=dataclasses.field(default=(), init=False, repr=False, compare=False)
+	_content_versions_by_id:dict[uuid.UUID,"ContentVersion"]=dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		"""Bind each segment back to this composition in place, and index everything in playback order"""
+
+		# Segments play back-to-back, so each starts where the previous one ended
+		rel_offset = 0
+		for seg in self._segments:
+			object.__setattr__(seg, "_src_cpl", self)
+			object.__setattr__(seg, "_src_offset", rel_offset)
+			object.__setattr__(seg, "_timecode_range", None)
+			rel_offset += seg.duration
+		
+		segments = tuple(self._segments)
+		sequences = tuple(seq for seg in segments for seq in seg._sequences)
+		resources = tuple(res for seq in sequences for res in seq._resources)
+
+		object.__setattr__(self, "_segments_flat", segments)
+		object.__setattr__(self, "_sequences_flat", sequences)
+		object.__setattr__(self, "_resources_flat", resources)
+		object.__setattr__(self, "_content_versions_by_id", {cv.id: cv for cv in self.content_versions})
+
 	@staticmethod
 	def xsd_optional_compositiontimecode(xml:et.Element, ns:typing.Optional[dict]=None, default:typing.Optional[timecode.Timecode]=None) -> timecode.Timecode:
 		"""Return a Timecode object from an XSD CompositionTimecodeType"""
@@ -726,10 +777,9 @@ class Cpl:
 		if xml is None:
 			return default
 
-		tc_addr = xml.find("TimecodeStartAddress",ns).text
-		tc_rate = int(xml.find("TimecodeRate",ns).text)
-		tc_drop = xsd_optional_bool(xml.find("TimecodeDropFrame",ns))
-		return timecode.Timecode(tc_addr, tc_rate, timecode.Timecode.Mode.DF if tc_drop else timecode.Timecode.Mode.NDF)
+		attrs = xsd_parse_fields(xml, cpl_fields(COMPOSITION_TIMECODE_FIELDS, ns), ns, required=("drop_frame","rate","address"))
+		mode = timecode.Timecode.Mode.DF if attrs["drop_frame"] else timecode.Timecode.Mode.NDF
+		return timecode.Timecode(attrs["address"], attrs["rate"], mode)
 	
 	@staticmethod
 	def xsd_optional_runtime(xml:et.Element, ns:typing.Optional[dict]=None, default:typing.Optional[datetime.timedelta]=None) -> datetime.timedelta:
@@ -737,113 +787,119 @@ class Cpl:
 		if xml is None:
 			return default
 		
-		runtime = [int(x) for x in xml.text.split(":")]
-		return datetime.timedelta(hours=int(runtime[0], minutes=runtime[1], seconds=runtime[2]))
+		hours, minutes, seconds = map(int, xml.text.split(":"))
+		return datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds)
 	
 	@classmethod
 	def from_file(cls, path:str) -> "Cpl":
 		"""Parse an existing CPL from a given file path."""
-		file_cpl = et.parse(path)
-		return cls.from_xml(file_cpl.getroot(), {"":"http://www.smpte-ra.org/schemas/2067-3/2016"})
+
+		ns = NS_CPL_DEFAULT
+		tag_segment, tag_segment_list = cpl_tag("Segment", ns), cpl_tag("SegmentList", ns)
+
+		# Stream the file, converting each Segment as soon as it closes and freeing its subtree,
+		# so the DOM of the whole composition is never held in memory at once
+		segment_list = list()
+		for _, elem in et.iterparse(path, events=("end",)):
+			if elem.tag == tag_segment:
+				segment_list.append(Segment.from_xml(elem, ns))
+				elem.clear()
+			elif elem.tag == tag_segment_list:
+				elem.clear()
+		
+		# The last element to close is the root
+		return cls.from_xml(elem, ns, segments=segment_list)
+	
+	@classmethod
+	def from_files(cls, paths:typing.Iterable[str], workers:typing.Optional[int]=None) -> list["Cpl"]:
+		"""Parse several existing CPLs in parallel worker processes, returned in the order given"""
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+			return list(executor.map(cls.from_file, paths))
 	
 	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Cpl":
+	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None, segments:typing.Optional[list["Segment"]]=None)->"Cpl":
 		"""
 		Parse an existing CPL from a given root XMLElementTree Element
 		Intended to be called from Cpl.from_file(), but you do you.
+
+		If `segments` have already been parsed (as when streaming from a file), they are used in place of the `SegmentList` element.
 		"""
 		
-		id = uuid.UUID(xml.find("Id",ns).text)
-		issue_date = xsd_datetime_to_datetime(xml.find("IssueDate",ns).text)
-		title = xml.find("ContentTitle",ns).text
-
-		annotation = xsd_optional_usertext(xml.find("Annotation",ns))
-		issuer = xsd_optional_usertext(xml.find("Issuer",ns))
-		creator = xsd_optional_usertext(xml.find("Creator",ns))
-		content_originator = xsd_optional_usertext(xml.find("ContentOriginator",ns))
-		content_kind = xsd_optional_usertext(xml.find("ContentKind",ns))
-
-		# Rate and timecode
-		edit_rate = EditRate.from_xml(xml.find("EditRate",ns), ns)
-		tc_start = cls.xsd_optional_compositiontimecode(xml.find("CompositionTimecode",ns),ns)
-
-		# Runtime is just hh:mm:ss and not to be trusted
-		runtime = cls.xsd_optional_runtime(xml.find("TotalRuntime",ns))
-		
-		# ContentVersionList
-		content_versions = [ContentVersion.from_xml(cv,ns) for cv in xml.findall("ContentVersionList/ContentVersion",ns)]
-		
-		# Locales
-		locale_list = [Locale.from_xml(locale,ns) for locale in xml.findall("LocaleList/Locale",ns)]
-		
-		# Extensions
-		extensions_list = [ExtensionProperty.from_xml(prop,ns) for prop in xml.findall("ExtensionProperties/*",ns)]
-
-		# Essence descriptors
-		essence_descriptors = [EssenceDescriptor.from_xml(ess,ns) for ess in xml.findall("EssenceDescriptorList/EssenceDescriptor",ns)]
+		attrs = xsd_parse_fields(xml, cpl_fields(CPL_FIELDS, ns), ns, required=("id","issue_date","title","edit_rate","_segments"))
+		if segments is not None:
+			attrs["_segments"] = segments
 
 		# Signer and signature
 		# TODO: Definitely needs testing
-		security = xsd_optional_security(
-			xml_signer=xml.find("Signer",ns),
-			xml_signature=xml.find("ds:Signature",{"ds":"http://www.w3.org/2000/09/xmldsig#"})
+		attrs["security"] = xsd_optional_security(
+			xml_signer=attrs.pop("_signer", None),
+			xml_signature=attrs.pop("_signature", None)
 		)
 
-		# Segments!
-		segment_list = [Segment.from_xml(segment,ns) for segment in xml.find("SegmentList",ns)]
-
-		return cls(
-			id=id,
-			issue_date=issue_date,
-			title=title,
-			edit_rate=edit_rate,
-			_segments=segment_list,
-			annotation=annotation,
-			issuer=issuer,
-			creator=creator,
-			content_originator=content_originator,
-			content_kind=content_kind,
-			tc_start=tc_start,
-			total_runtime=runtime,
-			content_versions=content_versions,
-			locales=locale_list,
-			extension_properties=extensions_list,
-			security=security,
-			essence_descriptors=essence_descriptors
-		)
+		return cls(**attrs)
+	
+	def get_content_version(self, id:typing.Union[str,uuid.UUID]) -> typing.Optional["ContentVersion"]:
+		"""Get a ContentVersion from the CPL based on its URN ID"""
+		if not isinstance(id, uuid.UUID): id = uuid.UUID(id)
+		return self._content_versions_by_id.get(id)
 	
 	@property
-	def segments(self) -> typing.Iterator["Segment"]:
-		for seg in self._segments:
-			rel_offset = 0
-			yield dataclasses.replace(
-				seg,
-				_src_cpl    =self,
-				_src_offset = rel_offset
-			)
-			rel_offset += seg.duration
+	def segments(self) -> tuple["Segment",...]:
+		"""All segments in playback order"""
+		return self._segments_flat
 	
 	@property
-	def sequences(self) -> typing.Iterator["Sequence"]:
-		for seg in self.segments:
-			for seq in seg.sequences:
-				yield seq
+	def sequences(self) -> tuple["Sequence",...]:
+		"""All sequences of all segments"""
+		return self._sequences_flat
 	
 	@property
-	def resources(self) -> typing.Iterator["BaseResource"]:
-		for seq in self.sequences:
-			for res in seq.resources:
-				yield res
+	def resources(self) -> tuple["BaseResource",...]:
+		"""All resources of all sequences"""
+		return self._resources_flat
 	
 	@property
 	def duration(self) -> int:
 		"""Duration in frames for now"""
-		return sum(seg.duration for seg in self.segments)
+		return sum(seg.duration for seg in self._segments)
 	
 	@property
 	def timecode_range(self) -> timecode.TimecodeRange:
 		"""Timecode range of the CPL"""
-		return timecode.TimecodeRange(
-			start    = self.tc_start,
-			duration = timecode.Timecode(self.duration, float(self.edit_rate))
-		)
+		if self._timecode_range is None:
+			object.__setattr__(self, "_timecode_range", timecode.TimecodeRange(
+				start    = self.tc_start,
+				duration = timecode.Timecode(self.duration, float(self.edit_rate))
+			))
+		return self._timecode_range
+
+# Child elements of a CompositionPlaylistType
+CPL_FIELDS = {
+	cpl_tag("Id"):                    ("id",                   xsd_uuid),
+	cpl_tag("IssueDate"):             ("issue_date",           lambda xml, ns: xsd_datetime_to_datetime(xml.text)),
+	cpl_tag("ContentTitle"):          ("title",                xsd_string),
+	cpl_tag("Annotation"):            ("annotation",           UserText.from_xml),
+	cpl_tag("Issuer"):                ("issuer",               UserText.from_xml),
+	cpl_tag("Creator"):               ("creator",              UserText.from_xml),
+	cpl_tag("ContentOriginator"):     ("content_originator",   UserText.from_xml),
+	cpl_tag("ContentKind"):           ("content_kind",         UserText.from_xml),
+	cpl_tag("EditRate"):              ("edit_rate",            EditRate.from_xml),
+	cpl_tag("CompositionTimecode"):   ("tc_start",             Cpl.xsd_optional_compositiontimecode),
+	# Runtime is just hh:mm:ss and not to be trusted
+	cpl_tag("TotalRuntime"):          ("total_runtime",        Cpl.xsd_optional_runtime),
+	cpl_tag("ContentVersionList"):    ("content_versions",     lambda xml, ns: [ContentVersion.from_xml(cv,ns) for cv in xml.iterfind(cpl_tag("ContentVersion", ns))]),
+	cpl_tag("LocaleList"):            ("locales",              lambda xml, ns: [Locale.from_xml(locale,ns) for locale in xml.iterfind(cpl_tag("Locale", ns))]),
+	cpl_tag("ExtensionProperties"):   ("extension_properties", lambda xml, ns: [ExtensionProperty.from_xml(prop,ns) for prop in xml]),
+	cpl_tag("EssenceDescriptorList"): ("essence_descriptors",  lambda xml, ns: [EssenceDescriptor.from_xml(ess,ns) for ess in xml.iterfind(cpl_tag("EssenceDescriptor", ns))]),
+	cpl_tag("SegmentList"):           ("_segments",            lambda xml, ns: [Segment.from_xml(segment,ns) for segment in xml]),
+	# Collected for `security`
+	cpl_tag("Signer"):                ("_signer",              lambda xml, ns: xml),
+	f"{{{NS_DS['ds']}}}Signature":    ("_signature",           lambda xml, ns: xml),
+}
+
+# Child elements of a CompositionTimecodeType
+COMPOSITION_TIMECODE_FIELDS = {
+	cpl_tag("TimecodeDropFrame"):     ("drop_frame",           lambda xml, ns: xsd_optional_bool(xml)),
+	cpl_tag("TimecodeRate"):          ("rate",                 xsd_integer),
+	cpl_tag("TimecodeStartAddress"):  ("address",              xsd_string),
+}
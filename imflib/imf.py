@@ -9,7 +9,7 @@ class Imf:
 	asset_map:assetmap.AssetMap
 	cpl:cpl.Cpl
 	pkl:pkl.Pkl
-	opl:typing.Optional[opl.Opl] = None
+	opl:typing.Optional["opl.Opl"] = None
 
 	@classmethod
 	def from_path(cls, path_imf:typing.Union[str,pathlib.Path]) -> "Imf":
@@ -27,13 +27,16 @@ class Imf:
 		
 		input_pkl = pkl.Pkl.from_file(pathlib.Path(path_imf,input_assetmap.packing_lists[0].file_paths[0]))
 		
+		# Scan the directory once and pick out the CPLs and OPLs by name
 		# TODO: Maybe go off like the PKL or ASSETMAP instead of globbin'
-		glob_temp = list(path_imf.glob("CPL*.xml"))
-		if not len(glob_temp):
+		paths_xml = [path for path in path_imf.iterdir() if path.name.endswith(".xml")]
+
+		paths_cpl = [path for path in paths_xml if path.name.startswith("CPL")]
+		if not len(paths_cpl):
 			raise FileNotFoundError("Could not find a CPL in this directory")
-		elif len(glob_temp) > 1:
-			raise NotImplementedError(f"Support for {len(glob_temp)} CPLs is not yet implemented")
-		input_cpl = cpl.Cpl.from_file(str(glob_temp[0]))
+		elif len(paths_cpl) > 1:
+			raise NotImplementedError(f"Support for {len(paths_cpl)} CPLs is not yet implemented")
+		input_cpl = cpl.Cpl.from_file(str(paths_cpl[0]))
 		
 		# Marry the pkl assets to the CPL
 		# BROKEN: I don't remember what I did here before.
@@ -41,12 +44,9 @@ class Imf:
 		#for res in input_cpl.resources:
 		#	res.setAsset(input_pkl.get_asset(res.file_id))
 
-		glob_temp = list(path_imf.glob("OPL*.xml"))
-		if len(glob_temp) > 1:
-			raise NotImplementedError(f"Support for {len(glob_temp)} OPLs is not yet implemented")
-		if glob_temp:
-			input_opl = opl.Opl.from_file(glob_temp[0])
-		else:
-			input_opl = None
+		paths_opl = [path for path in paths_xml if path.name.startswith("OPL")]
+		if len(paths_opl) > 1:
+			raise NotImplementedError(f"Support for {len(paths_opl)} OPLs is not yet implemented")
+		input_opl = opl.Opl.from_file(paths_opl[0]) if paths_opl else None
 		
 		return cls(input_assetmap, input_cpl, input_pkl, input_opl)
\ No newline at end of file
@@ -1,3 +1,4 @@
+# cython: language_level=3
 # TODO: Actually make this
 # https://smpte-ra.org/sites/default/files/st2067-100a-2014.xsd
 
@@ -5,20 +6,33 @@ import dataclasses, typing, datetime, abc, uuid, re
 import xml.etree.ElementTree as et
 from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, UserText, Security
 
+NS_OPL = "http://www.smpte-ra.org/schemas/2067-100/2014"
+"""The OPL namespace used by :meth:`Opl.from_file`"""
+
+NS_OPL_DEFAULT = {"":NS_OPL}
+"""Namespace map with the OPL namespace as the default, for `find` and friends"""
+
+XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+"""The `xsi:type` attribute in Clark notation, which identifies the type of each `Macro`"""
+
+def opl_tag(name:str) -> str:
+	"""Qualify an OPL element name in Clark notation (`{uri}name`)"""
+	return f"{{{NS_OPL}}}{name}"
+
 
 class MacroName(str):
 	"""A string restricted confined to the opl:MacroNameType schema"""
 
-	PAT_MACRO_NAME_TYPE = re.compile(r"^[a-zA-Z][a-zA-Z0-9-]*$")
+	PAT_MACRO_NAME_TYPE = re.compile(r"[a-zA-Z][a-zA-Z0-9-]*")
 
 	def __new__(cls, input_string:str):
-		if not cls.PAT_MACRO_NAME_TYPE.match(input_string):
+		if not cls.PAT_MACRO_NAME_TYPE.fullmatch(input_string):
 			raise ValueError("String does not validate against the opl:MacroNameType schema")
 		
 		return super().__new__(cls, input_string)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Macro(abc.ABC):
 	"""An abstract OPL Macro"""
 
@@ -35,12 +49,13 @@ class Macro(abc.ABC):
 	annotation_text:typing.Optional[UserText]=None
 	"""Optional description of this macro"""
 
-	@abc.abstractclassmethod
+	@classmethod
+	@abc.abstractmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Macro":
 		"""Parse Macro from XML"""
 	
 		
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class PresetMacro(Macro):
 	"""A Preset Macro"""
 
@@ -54,9 +69,9 @@ class PresetMacro(Macro):
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"PresetMacro":
 
-		name = MacroName(xml.find("Name",ns).text)
-		annotation_text = xsd_optional_usertext(xml.find("Annotation",ns))
-		preset = xml.find("Preset",ns).text
+		name = MacroName(xml.find(opl_tag("Name")).text)
+		annotation_text = xsd_optional_usertext(xml.find(opl_tag("Annotation")))
+		preset = xml.find(opl_tag("Preset")).text
 
 		return cls(
 			name=name,
@@ -68,16 +83,16 @@ MACRO_TYPES = {
 	"PresetMacroType":PresetMacro
 }
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Handle:
 	"""TODO"""
 
 	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=False) -> "Handle":
+	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "Handle":
 		return cls()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Alias:
 	"""An OPL Alias"""
 
@@ -103,23 +118,42 @@ class Alias:
 		)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True, init=False, repr=False)
 class ExtensionProperty:
 	"""An OPL Extension Property"""
 	# TODO: Spec loosely defines as lax processing, any namespace. Cool.
 	# TODO: Decide upon a better implementation.
-	raw_xml:str
+	element:typing.Optional[et.Element]
+	"""The extension property as parsed, if it was read from XML"""
+
+	# Serialized on first access when parsed from XML
+	_raw_xml:typing.Optional[str]=dataclasses.field(compare=False)
+
+	def __init__(self, raw_xml:typing.Optional[str]=None, element:typing.Optional[et.Element]=None):
+		"""Wrap an extension property given as an XML string (`raw_xml`) or as a parsed `element`"""
+		object.__setattr__(self, "element", element)
+		object.__setattr__(self, "_raw_xml", raw_xml)
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}(raw_xml={self.raw_xml!r})"
 
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"ExtensionProperty":
 		"""Capture an extention property from the list"""
-		try:
-			raw_xml = et.tostring(xml, encoding="unicode", method="xml").strip()
-		except Exception as e:
-			raw_xml = f"Unknown extension property: {e}"
-		return cls(raw_xml)
-
-@dataclasses.dataclass(frozen=True)
+		return cls(element=xml)
+	
+	@property
+	def raw_xml(self) -> str:
+		"""The extension property as an XML string"""
+		if self._raw_xml is None:
+			try:
+				raw_xml = et.tostring(self.element, encoding="unicode", method="xml").strip()
+			except Exception as e:
+				raw_xml = f"Unknown extension property: {e}"
+			object.__setattr__(self, "_raw_xml", raw_xml)
+		return self._raw_xml
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Opl:
 	"""An IMF Output Profile List"""
 
@@ -160,7 +194,7 @@ class Opl:
 	def from_file(cls, path:str) -> "Opl":
 		"""Parse an existing OPL from a given file path."""
 		file_opl = et.parse(path)
-		return cls.from_xml(file_opl.getroot(), {"":"http://www.smpte-ra.org/schemas/2067-100/2014"})
+		return cls.from_xml(file_opl.getroot(), NS_OPL_DEFAULT)
 	
 	@classmethod
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Opl":
@@ -169,27 +203,27 @@ class Opl:
 		Intended to be called from Opl.from_file(), but you do you.
 		"""
 
-		id = uuid.UUID(xml.find("Id", ns).text)
-		cpl_id = uuid.UUID(xml.find("CompositionPlaylistId",ns).text)
-		annotation_text = xsd_optional_usertext(xml.find("Annotation",ns))
-		issue_date = xsd_datetime_to_datetime(xml.find("IssueDate",ns).text)
-		issuer = xsd_optional_usertext(xml.find("Issuer",ns))
-		creator = xsd_optional_usertext(xml.find("Creator",ns))
+		id = uuid.UUID(xml.find(opl_tag("Id")).text)
+		cpl_id = uuid.UUID(xml.find(opl_tag("CompositionPlaylistId")).text)
+		annotation_text = xsd_optional_usertext(xml.find(opl_tag("Annotation")))
+		issue_date = xsd_datetime_to_datetime(xml.find(opl_tag("IssueDate")).text)
+		issuer = xsd_optional_usertext(xml.find(opl_tag("Issuer")))
+		creator = xsd_optional_usertext(xml.find(opl_tag("Creator")))
 
 		# Extension properties list
-		extension_properties = [prop for prop in xml.findall("ExtensionProperties",ns)]
+		extension_properties = [ExtensionProperty.from_xml(prop,ns) for props in xml.iterfind(opl_tag("ExtensionProperties")) for prop in props]
 		
 		# Alias set
-		alias_list = {alias_list.add(Alias.from_xml(alias,ns)) for alias in xml.find("AliasList",ns)}
+		alias_list = {Alias.from_xml(alias,ns) for alias in xml.iterfind(f"{opl_tag('AliasList')}/{opl_tag('Alias')}")}
 		
 		# Macro list
 		macro_list = list()
-		for macro in xml.find("MacroList",ns):
+		for macro in xml.iterfind(f"{opl_tag('MacroList')}/{opl_tag('Macro')}"):
 			# TODO: Probably want to move this off to a factory thingy
 			# <Macro> should contain an xsi:type attribute maybe
-			type_attrib = macro.attrib.get("{http://www.w3.org/2001/XMLSchema-instance}type")
-			if type_attrib in MACRO_TYPES:
-				macro_list.append(MACRO_TYPES.get(type_attrib).from_xml(macro,ns))
+			macro_type = MACRO_TYPES.get(macro.attrib.get(XSI_TYPE))
+			if macro_type is not None:
+				macro_list.append(macro_type.from_xml(macro,ns))
 
 		return cls(
 			id=id,
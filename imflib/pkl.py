@@ -1,12 +1,24 @@
+# cython: language_level=3
 # Based on SMPTE 429-8-2007: https://ieeexplore.ieee.org/document/7290849
 # With additions from SMPTE 2067-2-2020: https://ieeexplore.ieee.org/document/9097478
 
-import dataclasses, typing, datetime, uuid
+import dataclasses, typing, datetime, uuid, sys
 import xml.etree.ElementTree as et
 from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, xsd_optional_security
-from imflib import UserText, Security
+from imflib import xsd_string, xsd_integer, xsd_uuid, xsd_parse_fields
+from imflib import UserText, Security, NS_DS
 
-@dataclasses.dataclass(frozen=True)
+NS_PKL = "http://www.smpte-ra.org/schemas/2067-2/2016/PKL"
+"""The PKL namespace used by :meth:`Pkl.from_file`"""
+
+NS_PKL_DEFAULT = {"":NS_PKL}
+"""Namespace map with the PKL namespace as the default, for `find` and friends"""
+
+def pkl_tag(name:str) -> str:
+	"""Qualify a PKL element name in Clark notation (`{uri}name`)"""
+	return f"{{{NS_PKL}}}{name}"
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Asset:
 	"""An asset packed into this IMF package"""
 
@@ -35,26 +47,7 @@ class Asset:
 	def from_xml(cls, xml:et.Element, ns:dict) -> "Asset":
 		"""Create an asset from an XML element"""
 
-		id = uuid.UUID(xml.find("Id", ns).text)
-		size = int(xml.find("Size", ns).text)
-		type = xml.find("Type", ns).text
-		
-		# As of 2067-2-2020, http://www.w3.org/2000/09/xmldsig#sha1 is the only supported algorithm
-		hash = xml.find("Hash", ns).text
-		hash_algorithm = xml.find("HashAlgorithm", ns).attrib.get("Algorithm").split("#")[-1]
-		
-		original_file_name = xsd_optional_usertext(xml.find("OriginalFileName", ns))
-		annotation_text = xsd_optional_usertext(xml.find("AnnotationText", ns))
-		
-		return cls(
-			id=id,
-			hash=hash,
-			hash_algorithm=hash_algorithm,
-			size=size,
-			type=type,
-			original_file_name=original_file_name,
-			annotation_text=annotation_text
-		)
+		return cls(**xsd_parse_fields(xml, ASSET_FIELDS, ns, required=("id","hash","hash_algorithm","size","type")))
 	
 	def __post_init__(self):
 		"""Validate additional constraints"""
@@ -64,8 +57,21 @@ class Asset:
 
 		# TODO: Add mime-type guessing via `mimetypes` module? Or maybe nah.
 
-
-@dataclasses.dataclass(frozen=True)
+# Child elements of a PKL Asset
+# Most assets in a package share a handful of MIME types and digests; intern them rather than keep a copy per asset
+# As of 2067-2-2020, http://www.w3.org/2000/09/xmldsig#sha1 is the only supported algorithm
+ASSET_FIELDS = {
+	pkl_tag("Id"):               ("id",                 xsd_uuid),
+	pkl_tag("AnnotationText"):   ("annotation_text",    UserText.from_xml),
+	pkl_tag("Hash"):             ("hash",               xsd_string),
+	pkl_tag("Size"):             ("size",               xsd_integer),
+	pkl_tag("Type"):             ("type",               lambda xml, ns: sys.intern(xml.text)),
+	pkl_tag("OriginalFileName"): ("original_file_name", UserText.from_xml),
+	pkl_tag("HashAlgorithm"):    ("hash_algorithm",     lambda xml, ns: sys.intern(xml.attrib.get("Algorithm").rpartition("#")[2])),
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Pkl:
 	"""An IMF PKL Packing List"""
 
@@ -99,35 +105,59 @@ class Pkl:
 	security:typing.Optional[Security]=None
 	"""Optional digital signer and signature authenticating the PKL"""
 
+	# Index of `assets` by id, and their total size, built in __post_init__
+	_assets_by_id:dict[uuid.UUID,"Asset"]=dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
+	_total_size:int=dataclasses.field(default=0, init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		object.__setattr__(self, "_assets_by_id", {asset.id: asset for asset in self.assets})
+		object.__setattr__(self, "_total_size", sum(asset.size for asset in self.assets))
+
 
 	@classmethod
 	def from_file(cls, path:str) -> "Pkl":
 		"""Parse an existing PKL from a given file path"""
 
-		file_pkl = et.parse(path)
-		return cls.from_xml(file_pkl.getroot(), {"":"http://www.smpte-ra.org/schemas/2067-2/2016/PKL"})
+		ns = NS_PKL_DEFAULT
+		tag_asset, tag_asset_list = pkl_tag("Asset"), pkl_tag("AssetList")
+
+		# Stream the file, converting each Asset as soon as it closes and freeing its subtree
+		asset_list = list()
+		for _, elem in et.iterparse(path, events=("end",)):
+			if elem.tag == tag_asset:
+				asset_list.append(Asset.from_xml(elem, ns))
+				elem.clear()
+			elif elem.tag == tag_asset_list:
+				elem.clear()
+		
+		# The last element to close is the root
+		return cls.from_xml(elem, ns, assets=asset_list)
 	
 	@classmethod
-	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Pkl":
-		"""Parse a PKL from XML"""
+	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None, assets:typing.Optional[list["Asset"]]=None)->"Pkl":
+		"""
+		Parse a PKL from XML
 
-		print(xml.tag)
+		If `assets` have already been parsed (as when streaming from a file), they are used in place of the `AssetList` element.
+		"""
 
-		id = uuid.UUID(xml.find("Id", ns).text)
-		issuer = UserText.from_xml(xml.find("Issuer", ns))
-		creator = UserText.from_xml(xml.find("Creator", ns))
-		issue_date = xsd_datetime_to_datetime(xml.find("IssueDate",ns).text)
+		id = uuid.UUID(xml.find(pkl_tag("Id")).text)
+		issuer = UserText.from_xml(xml.find(pkl_tag("Issuer")))
+		creator = UserText.from_xml(xml.find(pkl_tag("Creator")))
+		issue_date = xsd_datetime_to_datetime(xml.find(pkl_tag("IssueDate")).text)
 
-		# TODO: Iterator...?
-		assets = [Asset.from_xml(asset,ns) for asset in xml.findall("AssetList/Asset",ns)]
+		if assets is None:
+			assets = [Asset.from_xml(asset,ns) for asset in xml.iterfind(f"{pkl_tag('AssetList')}/{pkl_tag('Asset')}")]
 
-		annotation_text = xsd_optional_usertext(xml.find("AnnotationText", ns))
-		group_id = uuid.UUID(xml.find("GroupId", ns)) if xml.find("GroupId", ns) is not None else None
-		icon_id = uuid.UUID(xml.find("IconId", ns)) if xml.find("IconId", ns) is not None else None
+		annotation_text = xsd_optional_usertext(xml.find(pkl_tag("AnnotationText")))
+		xml_group_id = xml.find(pkl_tag("GroupId"))
+		group_id = uuid.UUID(xml_group_id.text) if xml_group_id is not None else None
+		xml_icon_id = xml.find(pkl_tag("IconId"))
+		icon_id = uuid.UUID(xml_icon_id.text) if xml_icon_id is not None else None
 
 		security = xsd_optional_security(
-			xml_signer=xml.find("Signer",ns),
-			xml_signature=xml.find("ds:Signature",{"ds":"http://www.w3.org/2000/09/xmldsig#"})
+			xml_signer=xml.find(pkl_tag("Signer")),
+			xml_signature=xml.find(f"{{{NS_DS['ds']}}}Signature")
 		)
 
 		return cls(
@@ -142,13 +172,27 @@ class Pkl:
 			security=security
 		)
 	
-	def get_asset(self, id:str) -> "Asset":
+	def get_asset(self, id:typing.Union[str,uuid.UUID]) -> typing.Optional["Asset"]:
 		"""Get an Asset from the PKL based on the URN ID"""
-		for asset in self.assets:
-			if asset.id == id: return asset		
-		return None
+		if not isinstance(id, uuid.UUID): id = uuid.UUID(id)
+		return self._assets_by_id.get(id)
 	
 	@property
 	def total_size(self)->int:
 		"""Total size of assets in bytes"""
-		return sum(a.size for a in self.assets)
\ No newline at end of file
+		return self._total_size
+	
+	@classmethod
+	def quick_total_size(cls, path:str) -> int:
+		"""Total size of assets in bytes, read from a PKL file without building the `Pkl` or its `Asset` s"""
+
+		tag_size, tag_asset = pkl_tag("Size"), pkl_tag("Asset")
+
+		total_size = 0
+		for _, elem in et.iterparse(path, events=("end",)):
+			if elem.tag == tag_size:
+				total_size += int(elem.text)
+			elif elem.tag == tag_asset:
+				elem.clear()
+		
+		return total_size
\ No newline at end of file
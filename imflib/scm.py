@@ -1,12 +1,34 @@
+# cython: language_level=3
 # Based on SMPTE 2067-9-2018: https://ieeexplore.ieee.org/document/8387023
 
 from io import TextIOWrapper
 import xml.etree.ElementTree as et
-import typing, dataclasses, uuid, datetime
-from imflib import UserText, Security
+import typing, dataclasses, uuid, datetime, functools
+from imflib import UserText, Security, NS_DS
 from imflib import xsd_optional_usertext, xsd_datetime_to_datetime, xsd_optional_security, datetime_to_xsd_datetime
 
-@dataclasses.dataclass(frozen=True)
+NS_SCM = "http://www.smpte-ra.org/ns/2067-9/2018"
+"""The SCM namespace"""
+
+NS_SCM_DEFAULT = {
+	"":     NS_SCM,
+	"scm":  NS_SCM,
+	"dcml": "http://www.smpte-ra.org/schemas/433/2008/dcmlTypes/",
+	"ds":   "http://www.w3.org/2000/09/xmldsig#",
+	"xs":   "http://www.w3.org/2001/XMLSchema"
+}
+"""Namespace map used by :meth:`SidecarCompositionMap.from_file`"""
+
+def scm_tag(name:str) -> str:
+	"""Qualify an SCM element name in Clark notation (`{uri}name`)"""
+	return f"{{{NS_SCM}}}{name}"
+
+@functools.lru_cache(maxsize=4096)
+def _parse_urn_uuid(urn:str) -> uuid.UUID:
+	"""Parse a urn:UUID, reusing the result for CPL Ids shared across many sidecar assets"""
+	return uuid.UUID(urn)
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class SidecarAsset:
 	"""A SMPTE ST 2017-9-2018 Sidecar Asset-to-CPL Mapping"""
 
@@ -22,8 +44,8 @@ class SidecarAsset:
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "SidecarAsset":
 		"""Parse a Sidecar Asset from XML"""
 
-		id = uuid.UUID(xml.find("Id",ns).text)
-		cpl_ids = {uuid.UUID(x.text) for x in xml.findall("AssociatedCPLList/CPLId",ns)}
+		id = uuid.UUID(xml.find(scm_tag("Id")).text)
+		cpl_ids = {_parse_urn_uuid(x.text) for x in xml.iterfind(f"{scm_tag('AssociatedCPLList')}/{scm_tag('CPLId')}")}
 
 		return cls(
 			id=id,
@@ -33,27 +55,20 @@ class SidecarAsset:
 	def to_xml(self) -> et.Element:
 		"""Build an XML representation of a SidecarAsset"""
 
-		ns = "{http://www.smpte-ra.org/ns/2067-9/2018}"
-
-		root = et.Element(ns+"SidecarAsset")
-		
-		id = et.Element(ns+"Id")
-		id.text = str(self.id.urn)
-		root.append(id)
+		root = et.Element(scm_tag("SidecarAsset"))
+		et.SubElement(root, scm_tag("Id")).text = self.id.urn
 
-		cplids = et.Element(ns+"AssociatedCPLList")
+		cplids = et.SubElement(root, scm_tag("AssociatedCPLList"))
+		tag_cplid = scm_tag("CPLId")
 		for cplid in self.associated_cpl_ids:
-			el = et.Element(ns+"CPLId")
-			el.text = str(cplid.urn)
-			cplids.append(el)
-		root.append(cplids)
+			et.SubElement(cplids, tag_cplid).text = cplid.urn
 
 
 		return root
 
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SidecarCompositionMap:
 	"""A SMPTE ST 2017-9-2018 Sidecar Composition Map"""
 
@@ -90,21 +105,22 @@ class SidecarCompositionMap:
 	def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "SidecarCompositionMap":
 		"""Parse an SCM from XML"""
 
-		id = uuid.UUID(xml.find("Id",ns).text)
+		id = uuid.UUID(xml.find(scm_tag("Id")).text)
 		
-		annotation = xsd_optional_usertext(xml.find("Properties/Annotation",ns))
-		issue_date = xsd_datetime_to_datetime(xml.find("Properties/IssueDate",ns).text)
-		issuer = xsd_optional_usertext(xml.find("Properties/Issuer",ns))
-
-		# TODO: Need a better way
-		known_properties = {
-			xml.find("Properties/Annotation",ns),
-			xml.find("Properties/IssueDate",ns),
-			xml.find("Properties/Issuer",ns)
-		}
-		additional_properties = [x for x in xml.findall("Properties/*",ns) if x not in known_properties]
-		assets = [SidecarAsset.from_xml(a,ns) for a in xml.findall("SidecarAssetList/SidecarAsset",ns)]
-		securtity = xsd_optional_security(xml.find("Signer",ns),xml.find("Signature",ns))
+		# Sort the standard properties from any additional ones in a single pass
+		known_properties = dict()
+		additional_properties = list()
+		for prop in xml.find(scm_tag("Properties")):
+			if prop.tag in SCM_KNOWN_PROPERTIES:
+				known_properties[prop.tag] = prop
+			else:
+				additional_properties.append(prop)
+
+		annotation = xsd_optional_usertext(known_properties.get(scm_tag("Annotation")))
+		issue_date = xsd_datetime_to_datetime(known_properties[scm_tag("IssueDate")].text)
+		issuer = xsd_optional_usertext(known_properties.get(scm_tag("Issuer")))
+		assets = [SidecarAsset.from_xml(a,ns) for a in xml.iterfind(f"{scm_tag('SidecarAssetList')}/{scm_tag('SidecarAsset')}")]
+		securtity = xsd_optional_security(xml.find(scm_tag("Signer")),xml.find(f"{{{NS_DS['ds']}}}Signature"))
 
 		return cls(
 			id=id,
@@ -119,40 +135,30 @@ class SidecarCompositionMap:
 	def to_xml(self) -> et.Element:
 		"""Return an XML representation of this Sidecar Composition Map"""
 
-		et.register_namespace("","http://www.smpte-ra.org/ns/2067-9/2018")
+		et.register_namespace("",NS_SCM)
 
-		ns = "{http://www.smpte-ra.org/ns/2067-9/2018}"
+		root = et.Element(scm_tag("SidecarCompositionMap"))
+		et.SubElement(root, scm_tag("Id")).text = self.id.urn
 
-		root = et.Element(ns+"SidecarCompositionMap")
-		
-		id = et.Element(ns+"Id")
-		id.text = self.id.urn
-		root.append(id)
-
-		props = et.Element(ns+"Properties")
-		issue_date = et.Element(ns+"IssueDate")
-		issue_date.text = datetime_to_xsd_datetime(self.issue_date)
-		props.append(issue_date)
+		props = et.SubElement(root, scm_tag("Properties"))
+		et.SubElement(props, scm_tag("IssueDate")).text = datetime_to_xsd_datetime(self.issue_date)
 
 		if self.annotation:
 			annotation = self.annotation.to_xml()
-			annotation.tag = ns+"Annotation"
+			annotation.tag = scm_tag("Annotation")
 			props.append(annotation)		
 
 		if self.issuer:
 			issuer = self.issuer.to_xml()
-			issuer.tag = ns+"Issuer"
+			issuer.tag = scm_tag("Issuer")
 			props.append(issuer)
 
 		for addtl in self.additional_properties:
 			props.append(addtl)
 
-		root.append(props)
-
-		assetlist = et.Element(ns+"SidecarAssetList")
+		assetlist = et.SubElement(root, scm_tag("SidecarAssetList"))
 		for asset in self.assets:
 			assetlist.append(asset.to_xml())
-		root.append(assetlist)
 
 		return root
 
@@ -160,14 +166,7 @@ class SidecarCompositionMap:
 	def from_file(cls, path:str) -> "SidecarCompositionMap":
 		"""Parse an existing SCM from a given file path"""
 		xml_scm = et.parse(path)
-		return cls.from_xml(xml_scm.getroot(), {
-			"":     "http://www.smpte-ra.org/ns/2067-9/2018",
-			"scm":  "http://www.smpte-ra.org/ns/2067-9/2018",
-			"dcml": "http://www.smpte-ra.org/schemas/433/2008/dcmlTypes/",
-			"ds":   "http://www.w3.org/2000/09/xmldsig#",
-			"xs":   "http://www.w3.org/2001/XMLSchema"
-			}
-		)
+		return cls.from_xml(xml_scm.getroot(), NS_SCM_DEFAULT)
 	
 	def to_file(self, file:TextIOWrapper):
 		"""Write to a file"""
@@ -183,3 +182,6 @@ class SidecarCompositionMap:
 			),
 			file=file
 		)
+
+# Properties with their own fields on `SidecarCompositionMap`; any others are kept as additional properties
+SCM_KNOWN_PROPERTIES = {scm_tag("Annotation"), scm_tag("IssueDate"), scm_tag("Issuer")}
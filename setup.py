@@ -1,7 +1,21 @@
 import setuptools
 
+# Compile the parsing modules to C extensions when Cython is available.
+# The pure-Python sources remain the reference implementation and are used as-is otherwise.
+try:
+	from Cython.Build import cythonize
+except ImportError:
+	ext_modules = []
+else:
+	ext_modules = cythonize(["imflib/cpl.py", "imflib/pkl.py", "imflib/opl.py", "imflib/scm.py"], compiler_directives={"language_level":3, "annotation_typing":False})
+	for ext in ext_modules:
+		# Fall back to the pure-Python module if the extension fails to build
+		ext.optional = True
+
 setuptools.setup(
 	name="imflib",
 	version="0.1",
 	packages=["imflib"],
-)
\ No newline at end of file
+	python_requires=">=3.10",
+	ext_modules=ext_modules,
+)
@@ -1,28 +1,40 @@
 from imflib import assetmap
-import sys, pathlib
+import sys, pathlib, concurrent.futures
 
-if not len(sys.argv) > 1:
-	sys.exit("Usage: text_assetmap.py path_to_imf [path_to_imf ...]")
+def _process_imf(path_imf:str) -> str:
+	"""Summarize the asset map of an IMF"""
 
-for path_imf in sys.argv[1:]:
 	path_assetmap = pathlib.Path(path_imf,"ASSETMAP.xml")
 
 	am = assetmap.AssetMap.from_file(path_assetmap)
 
 	asset_pkl = am.packing_lists
 
+	summary = []
 	if not asset_pkl:
-		print("No packing list found")
+		summary.append("No packing list found")
 	else:
 		for pkl in asset_pkl:
-			print(f"{path_imf.split('/')[-1]}")
-			print(f"Package ID is {am.id}")
-			print(f"Created on {am.issue_date} by {am.issuer} using {am.creator}.")
+			summary.append(f"{path_imf.split('/')[-1]}")
+			summary.append(f"Package ID is {am.id}")
+			summary.append(f"Created on {am.issue_date} by {am.issuer} using {am.creator}.")
 			if am.total_size is not None:
-				print(f"Total size of assets: {am.total_size/1024/1024/1024:.02f} GB")
+				summary.append(f"Total size of assets: {am.total_size/1024/1024/1024:.02f} GB")
 			else:
-				print(f"Total size of assets is undefined")
-			print(f"Contains {len(am.packing_lists)} packing list(s) and {len(am.assets)-len(am.packing_lists)} assets:")
+				summary.append(f"Total size of assets is undefined")
+			summary.append(f"Contains {len(am.packing_lists)} packing list(s) and {len(am.assets)-len(am.packing_lists)} assets:")
 			for asset in am.assets:
-				print(f"  {asset.id}  {', '.join(asset.file_paths)} ({len(asset.chunks)} chunks)")
-		print("---")
\ No newline at end of file
+				summary.append(f"  {asset.id}  {', '.join(asset.file_paths)} ({len(asset.chunks)} chunks)")
+		summary.append("---")
+
+	return "\n".join(summary)
+
+if __name__ == "__main__":
+
+	if not len(sys.argv) > 1:
+		sys.exit("Usage: text_assetmap.py path_to_imf [path_to_imf ...]")
+
+	# Each IMF parses independently; spread them across cores and print in argument order
+	with concurrent.futures.ProcessPoolExecutor() as executor:
+		for summary in executor.map(_process_imf, sys.argv[1:]):
+			print(summary)
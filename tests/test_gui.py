@@ -1,7 +1,7 @@
 from PySide6 import QtCore, QtWidgets, QtGui
 from imflib import imf, cpl
 from posttools import timecode
-import sys, pathlib
+import sys, pathlib, os.path
 
 from imflib.cpl import AudioResource, ImageResource
 
@@ -15,40 +15,79 @@ class DiffList(QtWidgets.QTreeWidget):
 		self.setSortingEnabled(True)
 		self.setIndentation(False)
 		self.setAlternatingRowColors(True)
+		self.setUniformRowHeights(True)
+
+		# Collapse back-to-back IMF changes into a single refill on the next event loop pass
+		self._pending_imf = None
+		self._refresh_timer = QtCore.QTimer(self)
+		self._refresh_timer.setSingleShot(True)
+		self._refresh_timer.setInterval(0)
+		self._refresh_timer.timeout.connect(self._doRefill)
 	
 	@QtCore.Slot()
 	def slot_imfChanged(self, imf:imf.Imf):
+		self._pending_imf = imf
+		self._refresh_timer.start()
+	
+	def _doRefill(self):
+		"""Rebuild the list from the most recently chosen IMF"""
+		imf, self._pending_imf = self._pending_imf, None
+		if imf is None:
+			return
+
 		self.clear()
-		resources = list()
-		
-		# Here we go now
-		for segment in imf.cpl.segments:
-			for sequence in segment.sequences:
-				tc_start = imf.cpl.tc_start
-				for resource in sequence.resources:
-					if isinstance(resource, cpl.Resource):
-						tc_out = tc_start + resource.duration
-						asset = imf.pkl.getAsset(resource.file_id)
-						file_name = asset.file_name if asset else "External"
-						essence_type = "Video" if isinstance(resource, cpl.ImageResource) else "Audio"
-						self.addTopLevelItem(QtWidgets.QTreeWidgetItem([
-							str(tc_start),
-							str(tc_out),
-							str(resource.in_point),
-							str(resource.out_point),
-							str(resource.duration),
-							str(resource.edit_rate_formatted),
-							file_name,
-							resource.file_id,
-							essence_type
-						]))
-						tc_start = tc_out
+		items = list()
+
+		# Hold off sorting and repaints until the whole list is in
+		self.setSortingEnabled(False)
+		self.setUpdatesEnabled(False)
+
+		try:
+			# Resolve everything the loop needs up front
+			tc_program_start = imf.cpl.tc_start
+			cpl_edit_rate = imf.cpl.edit_rate
+			get_asset = imf.pkl.get_asset
+			add_item = items.append
+			tree_item = QtWidgets.QTreeWidgetItem
+			resource_type, image_resource_type = cpl.TrackFileResource, cpl.ImageResource
+
+			# Here we go now
+			for segment in imf.cpl.segments:
+				for sequence in segment.sequences:
+					tc_start = tc_program_start
+					# Each out point is the next in point; format it once and carry the string forward
+					str_tc_start = str(tc_start)
+					for resource in sequence.resources:
+						if isinstance(resource, resource_type):
+							tc_out = tc_start + resource.duration
+							str_tc_out = str(tc_out)
+							asset = get_asset(resource.track_file_id)
+							file_name = str(asset.original_file_name) if asset and asset.original_file_name else "External"
+							src_in = resource.edit_range.start
+							essence_type = "Video" if type(resource) is image_resource_type else "Audio"
+							add_item(tree_item((
+								str_tc_start,
+								str_tc_out,
+								str(src_in),
+								str(src_in + resource.source_duration),
+								str(resource.duration),
+								str(resource.edit_rate or cpl_edit_rate),
+								file_name,
+								str(resource.track_file_id),
+								essence_type
+							)))
+							tc_start, str_tc_start = tc_out, str_tc_out
 		
-		for x in range(self.columnCount()):
-			self.resizeColumnToContents(x)
+			self.addTopLevelItems(items)
+
+			self.header().resizeSections(QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
 		
-		#self.sortByColumn(self.headers.index("Essence Type"), QtCore.Qt.SortOrder.DescendingOrder)
-		self.sortByColumn(self.headers.index("Record In"), QtCore.Qt.SortOrder.AscendingOrder)
+			# Re-enabling sorting sorts by the header's indicator, so set that first and let it be the only sort
+			self.header().setSortIndicator(self.headers.index("Record In"), QtCore.Qt.SortOrder.AscendingOrder)
+		finally:
+			# Restore even if the fill fails, so the list isn't left frozen
+			self.setSortingEnabled(True)
+			self.setUpdatesEnabled(True)
 
 
 
@@ -83,10 +122,6 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.tb_main.setMovable(False)
 		self.addToolBar(self.tb_main)
 		self.setUnifiedTitleAndToolBarOnMac(True)
-	
-	@QtCore.Slot()
-	def slot_imfChanged(self, imf:imf.Imf):
-		pass
 
 		
 
@@ -161,7 +196,6 @@ class DiffFinder(QtWidgets.QApplication):
 		self.wnd_main.tb_main.addWidget(spacer)
 		#self.wnd_main.tb_main.addWidget(logo)
 
-		self.sig_imf_chosen.connect(self.wnd_main.slot_imfChanged)
 		self.sig_imf_chosen.connect(self.wnd_main.centralWidget().slot_imfChanged)
 		self.sig_imf_chosen.connect(self.lst_diff.slot_imfChanged)
 	
@@ -171,7 +205,7 @@ class DiffFinder(QtWidgets.QApplication):
 			return
 
 		try:
-			self.active_imf = imf.Imf.fromPath(selected)
+			self.active_imf = imf.Imf.from_path(selected)
 		except Exception as e:
 			QtWidgets.QMessageBox.critical(self.wnd_main, "Cannot Open IMF", f"The following error occurred when attempting to open this IMF:\n\n{e}")
 			return
@@ -190,21 +224,30 @@ class DiffFinder(QtWidgets.QApplication):
 			print(f"FCM: {'DROP FRAME' if self.active_imf.cpl.tc_start.mode == timecode.Timecode.Mode.DF else 'NON-DROP FRAME'}\n", file=edl_output)
 
 			idx_event = 1
+			get_asset = self.active_imf.pkl.get_asset
 
+			# Format every event first, then write them out in one go
+			events = list()
 			for segment in self.active_imf.cpl.segments:
 				for sequence in segment.sequences:
 					tc_start = self.active_imf.cpl.tc_start
+					str_tc_start = str(tc_start)
 					for clip in sequence.resources:
-						print("  ".join([
-							str(idx_event).zfill(4),
-							pathlib.Path(self.active_imf.pkl.getAsset(clip.file_id).file_name if self.active_imf.pkl.getAsset(clip.file_id) else "External").stem.ljust(128),
-							"V" if isinstance(clip, cpl.ImageResource) else "A",
-							"C",
-							f"{clip.in_point} {clip.out_point} {tc_start} {tc_start + clip.duration}"
-						]), file=edl_output)
+						# Markers have no essence to cut
+						if not isinstance(clip, cpl.TrackFileResource):
+							continue
+						asset = get_asset(clip.track_file_id)
+						reel = os.path.splitext(os.path.basename(str(asset.original_file_name) if asset and asset.original_file_name else "External"))[0].ljust(128)
+						track = "V" if type(clip) is cpl.ImageResource else "A"
+						src_in = clip.edit_range.start
+						tc_out = tc_start + clip.duration
+						str_tc_out = str(tc_out)
+						events.append(f"{idx_event:04}  {reel}  {track}  C  {src_in} {src_in + clip.source_duration} {str_tc_start} {str_tc_out}\n")
 						
-						tc_start += clip.duration
+						tc_start, str_tc_start = tc_out, str_tc_out
 						idx_event += 1
+			
+			edl_output.write("".join(events))
 
 			QtWidgets.QMessageBox.information(self.wnd_main,"EDL Complete",f"The EDL has been output to:\n\n{path_output}")
 
@@ -214,5 +257,6 @@ class DiffFinder(QtWidgets.QApplication):
 		
 
 
-app = DiffFinder()
-app.exec()
\ No newline at end of file
+if __name__ == "__main__":
+	app = DiffFinder()
+	app.exec()
\ No newline at end of file